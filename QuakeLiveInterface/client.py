@@ -2,9 +2,27 @@ from QuakeLiveInterface.connection import ServerConnection
 from QuakeLiveInterface.state import GameState
 
 class QuakeLiveClient:
-    def __init__(self, ip_address, port):
+    def __init__(
+        self, ip_address, port, max_pending_commands=16, max_command_length=1024
+    ):
         self.connection = ServerConnection(ip_address, port)
         self.game_state = GameState()
+        self.pending_commands = []
+        self.max_pending_commands = max_pending_commands
+        self.max_command_length = max_command_length
+        self.held_buttons = set()
+
+    def connect(self):
+        try:
+            self.connection.connect()
+        except Exception as e:
+            raise RuntimeError("Error while connecting") from e
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception as e:
+            raise RuntimeError("Error while closing connection") from e
 
     def update_game_state(self):
         try:
@@ -14,12 +32,26 @@ class QuakeLiveClient:
         except Exception as e:
             raise RuntimeError("Error while updating game state") from e
 
+    def drain_pending(self):
+        """Applies every state packet already received, without blocking."""
+        try:
+            for data_packet in self.connection.listen_pending():
+                self.game_state.update(data_packet)
+        except Exception as e:
+            raise RuntimeError("Error while updating game state") from e
+
     def get_player_position(self, player_id):
         try:
             return self.game_state.get_player_position(player_id)
         except Exception as e:
             raise RuntimeError("Error while retrieving player position") from e
 
+    def get_player_positions(self, player_ids):
+        try:
+            return self.game_state.get_player_positions(player_ids)
+        except Exception as e:
+            raise RuntimeError("Error while retrieving player positions") from e
+
     def get_item_location(self, item_id):
         try:
             return self.game_state.get_item_location(item_id)
@@ -27,48 +59,98 @@ class QuakeLiveClient:
             raise RuntimeError("Error while retrieving item location") from e
 
     def send_command(self, command):
+        data = command if isinstance(command, bytes) else command.encode()
+        self._track_button(data)
         try:
-            self.connection.send_command(command)
+            self.connection.send_command(data)
         except Exception as e:
             raise RuntimeError("Error while sending command") from e
 
+    def queue_command(self, command):
+        """Queues a command to be sent with the next flush().
+
+        A +button press is dropped while that button is still held, since
+        repeating it changes nothing. Presses and -button releases are tracked
+        across both queued and immediate commands, so a button released with
+        send_command() can be pressed again through the queue. The queue is
+        flushed automatically once it holds max_pending_commands commands.
+        Commands are stored encoded, so str and bytes commands can be mixed.
+        A command longer than max_command_length is rejected with ValueError
+        before it is queued, leaving the queue unchanged.
+        """
+        data = command if isinstance(command, bytes) else command.encode()
+        if len(data) > self.max_command_length:
+            raise ValueError(
+                f"Command of {len(data)} bytes exceeds max_length of "
+                f"{self.max_command_length}"
+            )
+        if not self._track_button(data):
+            return
+        self.pending_commands.append(data)
+        if len(self.pending_commands) >= self.max_pending_commands:
+            self.flush()
+
+    def flush(self):
+        """Sends all queued commands to the server in as few datagrams as possible."""
+        if not self.pending_commands:
+            return
+        commands, self.pending_commands = self.pending_commands, []
+        try:
+            self.connection.send_commands(commands, self.max_command_length)
+        except Exception as e:
+            raise RuntimeError("Error while sending commands") from e
+
+    def _track_button(self, data):
+        """Records a +button press or -button release.
+
+        Returns False if data presses a button that is already held.
+        """
+        if data.startswith(b"+"):
+            button = data[1:]
+            if button in self.held_buttons:
+                return False
+            self.held_buttons.add(button)
+        elif data.startswith(b"-"):
+            self.held_buttons.discard(data[1:])
+        return True
+
     # Movement commands:
     def move_forward(self):
-        self.send_command("+forward")
+        self.send_command(b"+forward")
 
     def move_backward(self):
-        self.send_command("-forward")
+        self.send_command(b"-forward")
 
     def move_left(self):
-        self.send_command("+moveleft")
+        self.send_command(b"+moveleft")
 
     def move_right(self):
-        self.send_command("+moveright")
+        self.send_command(b"+moveright")
 
     def jump(self):
-        self.send_command("+jump")
+        self.send_command(b"+jump")
 
     def crouch(self):
-        self.send_command("+crouch")
+        self.send_command(b"+crouch")
 
     # Combat commands:
     def shoot(self):
-        self.send_command("+attack")
+        self.send_command(b"+attack")
 
     def stop_shoot(self):
-        self.send_command("-attack")
+        self.send_command(b"-attack")
 
     def use_item(self):
-        self.send_command("+useitem")
+        self.send_command(b"+useitem")
 
     def reload_weapon(self):
-        self.send_command("+reload")
+        self.send_command(b"+reload")
 
     def next_weapon(self):
-        self.send_command("weapnext")
+        self.send_command(b"weapnext")
 
     def prev_weapon(self):
-        self.send_command("weapprev")
+        self.send_command(b"weapprev")
 
     # Communication commands:
     def say(self, message):
@@ -82,13 +164,13 @@ class QuakeLiveClient:
 
     # Miscellaneous:
     def toggle_console(self):
-        self.send_command("toggleconsole")
+        self.send_command(b"toggleconsole")
 
     def screenshot(self):
-        self.send_command("screenshot")
+        self.send_command(b"screenshot")
 
     def record_demo(self, demo_name):
         self.send_command(f"record {demo_name}")
 
     def stop_demo(self):
-        self.send_command("stoprecord")
+        self.send_command(b"stoprecord")
@@ -1,10 +1,15 @@
 import logging
+import random
+import select
 import socket
 import time
+from typing import Iterable, Union
 
+# Per-send records are logged at DEBUG, which this default level filters out
+# before any formatting happens.
 logging.basicConfig(
     filename="quakelive_interface.log",
-    level=logging.DEBUG,
+    level=logging.INFO,
     format="%(asctime)s [%(levelname)s] - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
@@ -13,10 +18,27 @@ logger = logging.getLogger(__name__)
 
 class ServerConnection:
     def __init__(self, host: str, port: int, sock=None):
-        logger.info(f"Initializing connection to {host}:{port}")
+        logger.info("Initializing connection to %s:%s", host, port)
         self.host = host
         self.port = port
+        self.address = (host, port)
         self.socket = sock or socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.connected = False
+        self.receive_buffer_size = None
+
+    def connect(self):
+        """Sets the server as the socket's default peer so sends skip address lookup.
+
+        A connected UDP socket only receives datagrams from host:port. If the
+        server sends state from a different address or port, listen() will
+        not see it; leave the socket unconnected in that case.
+        """
+        try:
+            self.socket.connect(self.address)
+        except socket.error as e:
+            logger.error("Error connecting to %s:%s: %s", self.host, self.port, e)
+            raise
+        self.connected = True
 
     def listen(self, buffer_size=4096):
         """Listens for incoming data from the server."""
@@ -24,25 +46,99 @@ class ServerConnection:
             data, _ = self.socket.recvfrom(buffer_size)
             return data
         except socket.error as e:
-            logger.error(f"Error while listening: {e}")
+            logger.error("Error while listening: %s", e)
             return None
 
+    def listen_pending(self, buffer_size=4096):
+        """Yields every datagram already waiting on the socket without blocking."""
+        sockets = [self.socket]
+        recv = self.socket.recv
+        while True:
+            try:
+                if not select.select(sockets, [], [], 0)[0]:
+                    return
+                data = recv(buffer_size)
+            except (ValueError, OSError) as e:
+                # select() raises ValueError once the socket has been closed.
+                logger.error("Error while listening: %s", e)
+                return
+            yield data
+
     def set_timeout(self, timeout):
         self.socket.settimeout(timeout)
 
-    def send_command(self, command: str):
+    def set_receive_buffer(self, size):
+        """Sizes the kernel receive buffer so bursts of packets are not dropped."""
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+        self.receive_buffer_size = size
+
+    def send_command(self, command: Union[str, bytes]):
+        """Sends a command to the server. Fixed commands may be passed pre-encoded."""
+        data = command if isinstance(command, bytes) else command.encode()
         try:
-            self.socket.sendto(command.encode(), (self.host, self.port))
-            logger.info(f"Sent command: {command}")
+            if self.connected:
+                self.socket.send(data)
+            else:
+                self.socket.sendto(data, self.address)
+            logger.debug("Sent command: %s", command)
         except socket.error as e:
-            logger.error(f"Error sending command: {command}. Error: {e}")
+            logger.error("Error sending command: %s. Error: %s", command, e)
+
+    def send_commands(self, commands: Iterable[Union[str, bytes]], max_length=1024):
+        """Sends several commands in as few datagrams as possible.
+
+        Commands are joined with ";" and split so that no datagram is longer
+        than max_length bytes, the longest console line the server accepts.
+        Raises ValueError, before anything is sent, if a single command is
+        longer than max_length.
+        """
+        encoded = [
+            command if isinstance(command, bytes) else command.encode()
+            for command in commands
+        ]
+        for data in encoded:
+            if len(data) > max_length:
+                raise ValueError(
+                    f"Command of {len(data)} bytes exceeds max_length of {max_length}"
+                )
+        batch = []
+        batch_length = -1
+        for data in encoded:
+            if batch and batch_length + 1 + len(data) > max_length:
+                self.send_command(b";".join(batch))
+                batch = []
+                batch_length = -1
+            batch.append(data)
+            batch_length += 1 + len(data)
+        if batch:
+            self.send_command(b";".join(batch))
+
+    def close(self):
+        """Closes the socket so it stops buffering incoming packets."""
+        self.socket.close()
+        self.connected = False
+
+    def reconnect(self, retries=3, delay=0.1, max_delay=2.0):
+        """Recreates the socket, backing off exponentially between failed attempts.
 
-    def reconnect(self, retries=3):
+        Each wait is jittered between half and all of the backoff so that
+        clients restarted together do not retry in lockstep.
+        """
         for i in range(retries):
             try:
                 self.socket.close()
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                if self.receive_buffer_size is not None:
+                    self.socket.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size
+                    )
+                if self.connected:
+                    self.socket.connect(self.address)
                 return
             except socket.error as e:
-                logger.error(f"Failed to reconnect, attempt {i+1}/{retries}: {e}")
-                time.sleep(2)  # Wait before retrying
+                logger.error(
+                    "Failed to reconnect, attempt %d/%d: %s", i + 1, retries, e
+                )
+                if i + 1 < retries:
+                    backoff = min(max_delay, delay * 2**i)
+                    time.sleep(random.uniform(backoff / 2, backoff))
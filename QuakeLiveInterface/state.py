@@ -18,6 +18,12 @@ PACKET_FORMATS = {
     PacketType.GAME_STATE_UPDATE: "Biiiiiiiiii",
 }
 
+# Compiled once so each packet is decoded without re-parsing its format string.
+PACKET_STRUCTS = {
+    packet_type: struct.Struct(packet_format)
+    for packet_type, packet_format in PACKET_FORMATS.items()
+}
+
 
 class GameState:
     def __init__(self):
@@ -26,46 +32,55 @@ class GameState:
         self.item_picked_by = {}
         self.player_ammo = {}
         self.player_health = {}
+        # Keyed by the raw header byte so update() skips building a PacketType.
+        self.packet_handlers = {
+            PacketType.PLAYER_MOVEMENT.value: self.handle_player_movement,
+            PacketType.ITEM_PICKUP.value: self.handle_item_pickup,
+            PacketType.PLAYER_SHOT.value: self.handle_player_shot,
+            PacketType.PLAYER_DEATH.value: self.handle_player_death,
+            PacketType.GAME_STATE_UPDATE.value: self.handle_game_state_update,
+        }
+
+    def _packet_header(self, data_packet: bytes) -> int:
+        if not data_packet:
+            raise ValueError("Invalid data packet format")
+        return data_packet[0]  # The header is the first byte
 
     def get_packet_type(self, data_packet: bytes) -> PacketType:
-        try:
-            header = struct.unpack("B", data_packet[:1])[0]  # Extract the header byte
-            return PacketType(header)
-        except struct.error as e:
-            raise ValueError("Invalid data packet format") from e
+        return PacketType(self._packet_header(data_packet))
 
     def update(self, data_packet: bytes):
         try:
-            packet_type = self.get_packet_type(data_packet)
-            if packet_type == PacketType.PLAYER_MOVEMENT:
-                self.handle_player_movement(data_packet)
-            elif packet_type == PacketType.ITEM_PICKUP:
-                self.handle_item_pickup(data_packet)
-            elif packet_type == PacketType.PLAYER_SHOT:
-                self.handle_player_shot(data_packet)
-            elif packet_type == PacketType.PLAYER_DEATH:
-                self.handle_player_death(data_packet)
-            elif packet_type == PacketType.GAME_STATE_UPDATE:
-                self.handle_game_state_update(data_packet)
-            else:
+            handler = self.packet_handlers.get(self._packet_header(data_packet))
+            if handler is None:
                 raise ValueError("Invalid packet type")
+            handler(data_packet)
         except Exception as e:
             raise RuntimeError("Error while updating game state") from e
 
     def handle_player_movement(self, data_packet: bytes):
         try:
-            _, player_id, x, y, z = struct.unpack(
-                PACKET_FORMATS[PacketType.PLAYER_MOVEMENT], data_packet
-            )
+            (
+                _,
+                player_id,
+                x,
+                y,
+                z,
+            ) = PACKET_STRUCTS[PacketType.PLAYER_MOVEMENT].unpack(data_packet)
             self.player_positions[player_id] = (x, y, z)
         except struct.error as e:
             raise ValueError("Invalid player movement packet format") from e
 
     def handle_item_pickup(self, data_packet: bytes):
         try:
-            _, item_id, player_id, x, y, z = struct.unpack(
-                PACKET_FORMATS[PacketType.ITEM_PICKUP], data_packet
-            )
+            (
+                _,
+                item_id,
+                player_id,
+                x,
+                y,
+                z,
+            ) = PACKET_STRUCTS[PacketType.ITEM_PICKUP].unpack(data_packet)
             self.item_picked_by[item_id] = player_id
             self.item_locations[item_id] = (x, y, z)
         except struct.error as e:
@@ -73,9 +88,13 @@ class GameState:
 
     def handle_player_shot(self, data_packet: bytes):
         try:
-            _, player_id, weapon_id, target_id, damage = struct.unpack(
-                PACKET_FORMATS[PacketType.PLAYER_SHOT], data_packet
-            )
+            (
+                _,
+                player_id,
+                weapon_id,
+                target_id,
+                damage,
+            ) = PACKET_STRUCTS[PacketType.PLAYER_SHOT].unpack(data_packet)
             # Deduct damage from the targeted player
             self.player_health[target_id] = max(
                 0, self.player_health.get(target_id, 100) - damage
@@ -85,9 +104,12 @@ class GameState:
 
     def handle_player_death(self, data_packet: bytes):
         try:
-            _, player_id, killer_id, weapon_id = struct.unpack(
-                PACKET_FORMATS[PacketType.PLAYER_DEATH], data_packet
-            )
+            (
+                _,
+                player_id,
+                killer_id,
+                weapon_id,
+            ) = PACKET_STRUCTS[PacketType.PLAYER_DEATH].unpack(data_packet)
             # Reset the player's game state after death
             self.player_health[player_id] = 100  # Reset to default health
             self.player_ammo[player_id] = self.default_ammo_count()
@@ -121,7 +143,7 @@ class GameState:
                 railgun_ammo,
                 plasma_ammo,
                 bfg_ammo,
-            ) = struct.unpack(PACKET_FORMATS[PacketType.GAME_STATE_UPDATE], data_packet)
+            ) = PACKET_STRUCTS[PacketType.GAME_STATE_UPDATE].unpack(data_packet)
             self.player_health[player_id] = health
             self.player_ammo[player_id] = {
                 "machine_gun": machine_gun_ammo,
@@ -139,5 +161,9 @@ class GameState:
     def get_player_position(self, player_id):
         return self.player_positions.get(player_id)
 
+    def get_player_positions(self, player_ids):
+        positions = self.player_positions
+        return [positions.get(player_id) for player_id in player_ids]
+
     def get_item_location(self, item_id):
         return self.item_locations.get(item_id)
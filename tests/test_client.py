@@ -1,6 +1,8 @@
+import struct
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from QuakeLiveInterface.client import QuakeLiveClient
+from QuakeLiveInterface.state import PacketType, PACKET_FORMATS
 
 
 class QuakeLiveClientTest(unittest.TestCase):
@@ -64,6 +66,101 @@ class QuakeLiveClientTest(unittest.TestCase):
             lambda: self.client.voice_chat(voice_command), f"voice_chat {voice_command}"
         )
 
+    def test_connect(self):
+        self.client.connect()
+        self.client.connection.socket.connect.assert_called_once_with(
+            ("127.0.0.1", 1234)
+        )
+
+    def test_close(self):
+        self.client.close()
+        self.client.connection.socket.close.assert_called_once()
+
+    def test_drain_pending(self):
+        fmt = PACKET_FORMATS[PacketType.PLAYER_MOVEMENT]
+        self.client.connection.socket.recv.side_effect = [
+            struct.pack(fmt, PacketType.PLAYER_MOVEMENT.value, 1, 1.0, 2.0, 3.0),
+            struct.pack(fmt, PacketType.PLAYER_MOVEMENT.value, 1, 4.0, 5.0, 6.0),
+        ]
+        readable = ([self.client.connection.socket], [], [])
+        with patch("select.select", side_effect=[readable, readable, ([], [], [])]):
+            self.client.drain_pending()
+        self.assertEqual(self.client.get_player_position(1), (4.0, 5.0, 6.0))
+
+    def test_errors_are_wrapped(self):
+        self.client.connection.socket.connect.side_effect = OSError("test error")
+        with self.assertRaises(RuntimeError) as context:
+            self.client.connect()
+        self.assertEqual(str(context.exception), "Error while connecting")
+        self.assertIsInstance(context.exception.__cause__, OSError)
+
+    def test_queue_command_and_flush(self):
+        self.client.queue_command("+forward")
+        self.client.queue_command("+attack")
+        self.client.connection.socket.sendto.assert_not_called()
+        self.client.flush()
+        self.client.connection.socket.sendto.assert_called_once()
+        self.assertEqual(
+            self.client.connection.socket.sendto.call_args[0][0].decode(),
+            "+forward;+attack",
+        )
+        self.assertEqual(self.client.pending_commands, [])
+
+    def test_queue_command_coalesces_repeated_presses(self):
+        for command in ["+forward", "+forward", "say hi", "say hi", "+forward"]:
+            self.client.queue_command(command)
+        self.assertEqual(
+            self.client.pending_commands,
+            [b"+forward", b"say hi", b"say hi"],
+        )
+
+    def test_queue_command_press_after_release(self):
+        self.client.queue_command("+forward")
+        self.client.queue_command("-forward")
+        self.client.queue_command("+forward")
+        self.assertEqual(
+            self.client.pending_commands, [b"+forward", b"-forward", b"+forward"]
+        )
+
+    def test_queue_command_press_after_immediate_release(self):
+        self.client.queue_command("+attack")
+        self.client.stop_shoot()
+        self.client.queue_command("+attack")
+        self.assertEqual(self.client.pending_commands, [b"+attack", b"+attack"])
+
+    def test_queue_command_bytes(self):
+        self.client.queue_command(b"+forward")
+        self.client.queue_command("+forward")
+        self.client.queue_command(b"weapnext")
+        self.client.flush()
+        self.assertEqual(
+            self.client.connection.socket.sendto.call_args[0][0],
+            b"+forward;weapnext",
+        )
+
+    def test_queue_command_auto_flush(self):
+        self.client.max_pending_commands = 2
+        self.client.queue_command("+forward")
+        self.client.connection.socket.sendto.assert_not_called()
+        self.client.queue_command("+attack")
+        self.client.connection.socket.sendto.assert_called_once()
+        self.assertEqual(self.client.pending_commands, [])
+
+    def test_queue_command_too_long(self):
+        self.client.max_command_length = 16
+        self.client.queue_command("+forward")
+        with self.assertRaises(ValueError):
+            self.client.queue_command("say " + "x" * 20)
+        self.assertEqual(self.client.pending_commands, [b"+forward"])
+        self.client.flush()
+        self.assertEqual(
+            self.client.connection.socket.sendto.call_args[0][0], b"+forward"
+        )
+
+    def test_flush_without_queued_commands(self):
+        self.client.flush()
+        self.client.connection.socket.sendto.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+import tempfile
 import unittest
 from unittest.mock import MagicMock, patch
 import socket
@@ -19,8 +23,24 @@ class ServerConnectionTest(unittest.TestCase):
         """Test proper initialization of the ServerConnection class."""
         self.assertEqual(self.connection.host, self.ip)
         self.assertEqual(self.connection.port, self.port)
+        self.assertEqual(self.connection.address, (self.ip, self.port))
         self.assertIsInstance(self.connection.socket, MagicMock)
 
+    def test_connect(self):
+        """Test connecting the socket to the server."""
+        self.connection.connect()
+        self.connection.socket.connect.assert_called_once_with((self.ip, self.port))
+        self.assertTrue(self.connection.connected)
+
+    def test_connect_error(self):
+        """Test connecting when an error occurs."""
+        self.connection.socket.connect.side_effect = socket.error("test error")
+        with self.assertLogs(level="ERROR") as log:
+            with self.assertRaises(socket.error):
+                self.connection.connect()
+            self.assertIn("Error connecting", log.output[0])
+        self.assertFalse(self.connection.connected)
+
     def test_listen_success(self):
         """Test listening for data successfully."""
         data_packet = b"test data"
@@ -34,12 +54,44 @@ class ServerConnectionTest(unittest.TestCase):
         result = self.connection.listen()
         self.assertIsNone(result)
 
+    def test_listen_pending(self):
+        """Test draining every datagram that is already waiting."""
+        readable = ([self.mock_socket], [], [])
+        self.connection.socket.recv.side_effect = [b"one", b"two"]
+        with patch("select.select", side_effect=[readable, readable, ([], [], [])]):
+            result = list(self.connection.listen_pending())
+        self.assertEqual(result, [b"one", b"two"])
+
+    def test_listen_pending_error(self):
+        """Test that draining stops when a read fails."""
+        readable = ([self.mock_socket], [], [])
+        self.connection.socket.recv.side_effect = socket.error("test error")
+        with patch("select.select", return_value=readable):
+            with self.assertLogs(level="ERROR"):
+                result = list(self.connection.listen_pending())
+        self.assertEqual(result, [])
+
+    def test_listen_pending_closed(self):
+        """Test that draining a closed connection logs and yields nothing."""
+        connection = ServerConnection("127.0.0.1", 27960)
+        connection.close()
+        with self.assertLogs(level="ERROR"):
+            result = list(connection.listen_pending())
+        self.assertEqual(result, [])
+
     def test_set_timeout(self):
         """Test setting socket timeout."""
         timeout_value = 5
         self.connection.set_timeout(timeout_value)
         self.connection.socket.settimeout.assert_called_once_with(timeout_value)
 
+    def test_set_receive_buffer(self):
+        """Test setting the socket receive buffer size."""
+        self.connection.set_receive_buffer(65536)
+        self.connection.socket.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 65536
+        )
+
     def test_send_command_success(self):
         """Test sending a command successfully."""
         command = "test_command"
@@ -48,6 +100,50 @@ class ServerConnectionTest(unittest.TestCase):
             command.encode(), (self.ip, self.port)
         )
 
+    def test_send_command_connected(self):
+        """Test sending a command over a connected socket."""
+        self.connection.connect()
+        self.connection.send_command("test_command")
+        self.connection.socket.send.assert_called_once_with(b"test_command")
+        self.connection.socket.sendto.assert_not_called()
+
+    def test_send_command_bytes(self):
+        """Test sending a pre-encoded command."""
+        self.connection.send_command(b"+forward")
+        self.connection.socket.sendto.assert_called_once_with(
+            b"+forward", (self.ip, self.port)
+        )
+
+    def test_send_commands(self):
+        """Test sending several commands in a single datagram."""
+        self.connection.send_commands(["+forward", "+attack"])
+        self.connection.socket.sendto.assert_called_once_with(
+            b"+forward;+attack", (self.ip, self.port)
+        )
+
+    def test_send_commands_mixed_types(self):
+        """Test sending a batch that mixes str and bytes commands."""
+        self.connection.send_commands([b"+forward", "say hi"])
+        self.connection.socket.sendto.assert_called_once_with(
+            b"+forward;say hi", (self.ip, self.port)
+        )
+
+    def test_send_commands_split(self):
+        """Test that long batches are split to stay within max_length."""
+        self.connection.send_commands(["+forward", "+attack", "+jump"], max_length=16)
+        self.assertEqual(
+            [c.args[0] for c in self.connection.socket.sendto.call_args_list],
+            [b"+forward;+attack", b"+jump"],
+        )
+
+    def test_send_commands_too_long(self):
+        """Test that a single command over max_length is rejected unsent."""
+        with self.assertRaises(ValueError):
+            self.connection.send_commands(
+                ["+forward", "say " + "x" * 20], max_length=16
+            )
+        self.connection.socket.sendto.assert_not_called()
+
     def test_send_command_error(self):
         """Test sending a command when an error occurs."""
         command = "test_command"
@@ -56,6 +152,13 @@ class ServerConnectionTest(unittest.TestCase):
             self.connection.send_command(command)
             self.assertIn("Error sending command", log.output[0])
 
+    def test_close(self):
+        """Test closing the connection."""
+        self.connection.connect()
+        self.connection.close()
+        self.mock_socket.close.assert_called_once()
+        self.assertFalse(self.connection.connected)
+
     def test_reconnect_success(self):
         """Test successful reconnection."""
         new_mock_socket = MagicMock()
@@ -63,6 +166,24 @@ class ServerConnectionTest(unittest.TestCase):
             self.connection.reconnect()
             self.mock_socket.close.assert_called_once()
 
+    def test_reconnect_connected(self):
+        """Test that reconnecting keeps the new socket connected."""
+        self.connection.connect()
+        new_mock_socket = MagicMock()
+        with patch("socket.socket", return_value=new_mock_socket):
+            self.connection.reconnect()
+        new_mock_socket.connect.assert_called_once_with((self.ip, self.port))
+
+    def test_reconnect_keeps_receive_buffer(self):
+        """Test that reconnecting re-applies the receive buffer size."""
+        self.connection.set_receive_buffer(65536)
+        new_mock_socket = MagicMock()
+        with patch("socket.socket", return_value=new_mock_socket):
+            self.connection.reconnect()
+        new_mock_socket.setsockopt.assert_called_once_with(
+            socket.SOL_SOCKET, socket.SO_RCVBUF, 65536
+        )
+
     def test_reconnect_failure(self):
         """Test failing to reconnect after max retries."""
         with patch.object(
@@ -72,6 +193,47 @@ class ServerConnectionTest(unittest.TestCase):
                 self.connection.reconnect()
                 self.assertIn("Failed to reconnect, attempt 3/3", log.output[2])
 
+    def test_reconnect_backoff(self):
+        """Test that retries back off exponentially up to the maximum delay."""
+        with patch.object(
+            socket, "socket", side_effect=socket.error("test error"), autospec=True
+        ), patch("time.sleep") as mock_sleep, patch(
+            "random.uniform", side_effect=lambda low, high: high
+        ) as mock_uniform:
+            with self.assertLogs(level="ERROR"):
+                self.connection.reconnect(retries=4, delay=0.5, max_delay=1.5)
+        self.assertEqual(
+            [c.args[0] for c in mock_sleep.call_args_list], [0.5, 1.0, 1.5]
+        )
+        self.assertEqual(
+            [c.args for c in mock_uniform.call_args_list],
+            [(0.25, 0.5), (0.5, 1.0), (0.75, 1.5)],
+        )
+
+    def test_default_logging_skips_sent_commands(self):
+        """Test that the default log file records errors but not every send."""
+        script = (
+            "import socket\n"
+            "from unittest.mock import MagicMock\n"
+            "from QuakeLiveInterface.connection import ServerConnection\n"
+            "connection = ServerConnection('127.0.0.1', 1234, sock=MagicMock())\n"
+            "connection.send_command('+forward')\n"
+            "connection.socket.sendto.side_effect = socket.error('test error')\n"
+            "connection.send_command('+attack')\n"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as tmp:
+            subprocess.run(
+                [sys.executable, "-c", script],
+                cwd=tmp,
+                env={**os.environ, "PYTHONPATH": root},
+                check=True,
+            )
+            with open(os.path.join(tmp, "quakelive_interface.log")) as log_file:
+                log = log_file.read()
+        self.assertIn("Error sending command: +attack", log)
+        self.assertNotIn("Sent command", log)
+
 
 if __name__ == "__main__":
     unittest.main()
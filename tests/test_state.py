@@ -18,6 +18,18 @@ class GameStateTest(unittest.TestCase):
         self.game_state.update(packet)
         self.assertEqual(self.game_state.get_player_position(player_id), position)
 
+    def test_get_player_positions(self):
+        self.game_state.update(
+            self.create_packet(PacketType.PLAYER_MOVEMENT, 1, 1.0, 2.0, 3.0)
+        )
+        self.game_state.update(
+            self.create_packet(PacketType.PLAYER_MOVEMENT, 2, 4.0, 5.0, 6.0)
+        )
+        self.assertEqual(
+            self.game_state.get_player_positions([2, 1, 3]),
+            [(4.0, 5.0, 6.0), (1.0, 2.0, 3.0), None],
+        )
+
     def test_handle_item_pickup(self):
         item_id = 2
         player_id = 1
@@ -76,10 +88,24 @@ class GameStateTest(unittest.TestCase):
             },
         )
 
+    def test_get_packet_type(self):
+        packet = self.create_packet(PacketType.PLAYER_DEATH, 1, 2, 1)
+        self.assertEqual(
+            self.game_state.get_packet_type(packet), PacketType.PLAYER_DEATH
+        )
+
+    def test_empty_packet(self):
+        with self.assertRaises(ValueError):
+            self.game_state.get_packet_type(b"")
+
     def test_invalid_packet(self):
         with self.assertRaises(RuntimeError):
             self.game_state.update(b"invalid_packet_data")
 
+    def test_update_empty_packet(self):
+        with self.assertRaises(RuntimeError):
+            self.game_state.update(b"")
+
 
 if __name__ == "__main__":
     unittest.main()